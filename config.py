@@ -1,5 +1,46 @@
 import os
+import copy
 import json
+import hashlib
+
+__all__ = ["Config", "get_config"]
+
+# JSON backend: orjson when installed, stdlib json otherwise. _loads is
+# also imported by language.py and main.py so the fallback lives here only.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=4).encode("utf-8")
+
+
+# Default configuration template, copied whenever defaults are needed
+_DEFAULT_CONFIG = {
+    "api_url": "https://api.xwamp.com",
+    "username": "user@example.com",
+    "token": "your_token_here",
+    "language": "auto",
+    "target_mark": "",
+    "apihz_id": "88888888",
+    "apihz_key": "88888888",
+    "is_path": False,
+    "auto_renew": True,
+    "log_settings": {
+        "log_dir": "logs",
+        "console_level": "info",
+        "file_level": "debug",
+        "max_size_mb": 5,
+        "backup_count": 3,
+    },
+}
 
 
 class Config:
@@ -10,7 +51,10 @@ class Config:
         self.config_path = config_path
         self.config = {}
         self.is_newly_created = False
+        self._saved_hash = None
         self.load_config()
+        if self._saved_hash is None:
+            self._saved_hash = self._hash_payload(self._serialize())
 
     def load_config(self):
         """
@@ -18,8 +62,8 @@ class Config:
         """
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    self.config = json.load(f)
+                with open(self.config_path, "rb") as f:
+                    self.config = _loads(f.read())
                 self.is_newly_created = False
             except json.JSONDecodeError:
                 print("Error parsing config file. Creating default configuration.")
@@ -34,23 +78,7 @@ class Config:
         """
         Create default configuration
         """
-        self.config = {
-            "api_url": "https://api.xwamp.com",
-            "username": "user@example.com",
-            "token": "your_token_here",
-            "language": "auto",
-            "target_mark": "",
-            "apihz_id": "88888888",
-            "apihz_key": "88888888",
-            "is_path": False,
-            "log_settings": {
-                "log_dir": "logs",
-                "console_level": "info",
-                "file_level": "debug",
-                "max_size_mb": 5,
-                "backup_count": 3,
-            },
-        }
+        self.config = copy.deepcopy(_DEFAULT_CONFIG)
         self.save_config()
 
     def validate_config(self):
@@ -58,46 +86,44 @@ class Config:
         Validate configuration file integrity, ensure all required keys exist
         Add default values for missing keys
         """
-        default_config = {
-            "api_url": "https://api.xwamp.com",
-            "username": "user@example.com",
-            "token": "your_token_here",
-            "language": "auto",
-            "target_mark": "",
-            "apihz_id": "88888888",
-            "apihz_key": "88888888",
-            "is_path": False,
-            "log_settings": {
-                "log_dir": "logs",
-                "console_level": "info",
-                "file_level": "debug",
-                "max_size_mb": 5,
-                "backup_count": 3,
-            },
-        }
-
-        # Check for missing top-level keys
-        for key, default_value in default_config.items():
-            if key not in self.config:
-                self.config[key] = default_value
-
-        # Check for missing nested log settings
-        if isinstance(self.config.get("log_settings"), dict):
-            for key, default_value in default_config["log_settings"].items():
-                if key not in self.config["log_settings"]:
-                    self.config["log_settings"][key] = default_value
-        else:
-            self.config["log_settings"] = default_config["log_settings"]
+        log_settings = self.config.get("log_settings")
+        if not isinstance(log_settings, dict):
+            log_settings = {}
 
-        # Save updated config if changes were made
-        self.save_config()
+        # Fill in missing top-level and nested log settings keys
+        merged = {**_DEFAULT_CONFIG, **self.config}
+        merged["log_settings"] = {**_DEFAULT_CONFIG["log_settings"], **log_settings}
+
+        # Save updated config only if changes were made
+        if merged != self.config:
+            self.config = merged
+            self.save_config()
+
+    def _serialize(self):
+        """
+        Serialize current configuration to bytes as written to disk
+        """
+        return _dumps(self.config)
+
+    @staticmethod
+    def _hash_payload(payload):
+        """
+        Compute digest of serialized configuration
+        """
+        return hashlib.blake2b(payload).digest()
 
     def save_config(self):
         """
-        Save current configuration to file
+        Save current configuration to file, skipping the write if the
+        serialized content is unchanged since the last save
         """
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(self.config, f, indent=4)
+        payload = self._serialize()
+        digest = self._hash_payload(payload)
+        if digest == self._saved_hash:
+            return
+        with open(self.config_path, "wb") as f:
+            f.write(payload)
+        self._saved_hash = digest
 
     def get(self, key, default=None):
         """
@@ -111,3 +137,35 @@ class Config:
         """
         self.config[key] = value
         self.save_config()
+
+    def set_many(self, values):
+        """
+        Set multiple configuration values and save to file once
+        """
+        self.config.update(values)
+        self.save_config()
+
+
+# Cache of Config instances keyed by resolved config file path
+_config_instances = {}
+
+
+def get_config(config_path="config.json"):
+    """
+    Get configuration instance (singleton pattern per config file)
+
+    This is the normal way to obtain configuration; constructing Config
+    directly always re-reads the file from disk.
+
+    Args:
+        config_path: Path to config file
+
+    Returns:
+        Config: Config instance
+    """
+    key = os.path.realpath(config_path)
+    instance = _config_instances.get(key)
+    if instance is None:
+        instance = Config(config_path)
+        _config_instances[key] = instance
+    return instance
@@ -1,7 +1,78 @@
 import locale
 import os
-import json
-from config import Config
+from functools import lru_cache
+from config import get_config, _loads
+
+
+def _detect_system_language():
+    """
+    Detect system language from environment, falling back to the locale
+    module only where no locale variables are set (e.g. Windows)
+
+    Returns:
+        str: Lowercase language code such as "zh_cn", or empty string
+    """
+    system_lang = (
+        os.environ.get("LC_ALL")
+        or os.environ.get("LC_MESSAGES")
+        or os.environ.get("LANG")
+        or ""
+    )
+    if not system_lang:
+        try:
+            system_lang = locale.getdefaultlocale()[0] or ""
+        except Exception:
+            pass
+    return system_lang.split(".")[0].lower()
+
+
+# System language is resolved once per process
+_SYSTEM_LANG = _detect_system_language()
+
+# Directory containing language files, resolved once at import
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_LANG_DIR = os.path.join(_MODULE_DIR, "lang")
+
+
+@lru_cache(maxsize=None)
+def _scan_lang_dir(lang_dir, mtime_ns):
+    """
+    Scan lang directory for language files, cached per directory mtime
+
+    Args:
+        lang_dir: Path to lang directory
+        mtime_ns: Directory modification time, used as cache key
+
+    Returns:
+        tuple: Available language codes
+    """
+    with os.scandir(lang_dir) as entries:
+        return tuple(
+            entry.name[:-5]
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
+
+
+@lru_cache(maxsize=None)
+def _load_lang_cached(lang_file, mtime_ns):
+    """
+    Load language translations from JSON file, cached per file mtime
+
+    Args:
+        lang_file: Path to language file
+        mtime_ns: File modification time, used as cache key
+
+    Returns:
+        dict: Language translations
+    """
+    try:
+        with open(lang_file, "rb") as f:
+            return _loads(f.read())
+    except Exception as e:
+        print(f"Error loading language file {lang_file}: {str(e)}")
+
+    return {}  # Return empty dict if file can't be loaded
 
 
 class Language:
@@ -14,15 +85,16 @@ class Language:
             config_instance: Existing Config instance to avoid circular import
         """
         # Use provided config or create new one
-        self.config = config_instance if config_instance else Config()
-        self.translations = {}
+        self.config = config_instance if config_instance else get_config()
 
         # Load available translations
         self.available_languages = self._get_available_languages()
 
-        # Load translations
-        for lang in self.available_languages:
-            self.translations[lang] = self._load_language_file(lang)
+        # Translations are loaded lazily per language on first use
+        self.translations = {}
+
+        # Callbacks notified when the current language changes
+        self._change_listeners = []
 
         # Determine language to use
         self.current_lang = self._determine_language(lang_code)
@@ -34,15 +106,12 @@ class Language:
         Returns:
             list: Available language codes
         """
-        lang_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lang")
-        available_langs = []
-
-        if os.path.exists(lang_dir):
-            for file in os.listdir(lang_dir):
-                if file.endswith(".json"):
-                    lang_code = os.path.splitext(file)[0]
-                    available_langs.append(lang_code)
+        try:
+            mtime_ns = os.stat(_LANG_DIR).st_mtime_ns
+        except OSError:
+            return ["en_us"]  # Default to English if lang directory is missing
 
+        available_langs = list(_scan_lang_dir(_LANG_DIR, mtime_ns))
         return available_langs or ["en_us"]  # Default to English if no languages found
 
     def _load_language_file(self, lang_code):
@@ -55,18 +124,14 @@ class Language:
         Returns:
             dict: Language translations
         """
-        lang_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "lang", f"{lang_code}.json"
-        )
+        lang_file = os.path.join(_LANG_DIR, f"{lang_code}.json")
 
-        if os.path.exists(lang_file):
-            try:
-                with open(lang_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading language file {lang_file}: {str(e)}")
+        try:
+            mtime_ns = os.stat(lang_file).st_mtime_ns
+        except OSError:
+            return {}  # Return empty dict if file doesn't exist
 
-        return {}  # Return empty dict if file doesn't exist or can't be loaded
+        return _load_lang_cached(lang_file, mtime_ns)
 
     def _determine_language(self, lang_code=None):
         """
@@ -80,31 +145,26 @@ class Language:
             str: Language code (en_us/zh_cn)
         """
         # 1. Use manual override if provided and available
-        if lang_code in self.translations:
+        if lang_code in self.available_languages:
             return lang_code
 
         # 2. Check config file
         config_lang = self.config.get("language")
-        if config_lang != "auto" and config_lang in self.translations:
+        if config_lang != "auto" and config_lang in self.available_languages:
             return config_lang
 
         # 3. Check system language
-        try:
-            system_lang = locale.getdefaultlocale()[0]
-            if system_lang:
-                if system_lang.startswith("zh"):
-                    if "zh_cn" in self.translations:
-                        return "zh_cn"
-                    elif "zh_tw" in self.translations:
-                        return "zh_tw"
-        except Exception:
-            pass
+        if _SYSTEM_LANG.startswith("zh"):
+            if "zh_cn" in self.available_languages:
+                return "zh_cn"
+            elif "zh_tw" in self.available_languages:
+                return "zh_tw"
 
         # 4. Default to English or first available language
-        if "en_us" in self.translations:
+        if "en_us" in self.available_languages:
             return "en_us"
-        elif self.translations:
-            return next(iter(self.translations))
+        elif self.available_languages:
+            return self.available_languages[0]
 
         return "en_us"  # Fallback to English ID even if not available
 
@@ -120,15 +180,33 @@ class Language:
             str: Translated text
         """
         # Get translation from current language or fallback to English
-        text = self.translations.get(self.current_lang, {}).get(key)
+        text = self._translations_for(self.current_lang).get(key)
         if text is None:
-            text = self.translations.get("en_us", {}).get(key, key)
+            text = self._translations_for("en_us").get(key, key)
 
         # Format with arguments if provided
         if args:
             return text.format(*args)
         return text
 
+    def _translations_for(self, lang_code):
+        """
+        Get translations for a language, loading its file on first use
+
+        Args:
+            lang_code: Language code
+
+        Returns:
+            dict: Language translations (empty if language is unavailable)
+        """
+        translations = self.translations.get(lang_code)
+        if translations is None:
+            if lang_code not in self.available_languages:
+                return {}
+            translations = self._load_language_file(lang_code)
+            self.translations[lang_code] = translations
+        return translations
+
     def change_language(self, lang_code):
         """
         Change current language
@@ -139,13 +217,37 @@ class Language:
         Returns:
             bool: True if language was changed, False otherwise
         """
-        if lang_code in self.translations:
+        if lang_code in self.available_languages:
             self.current_lang = lang_code
             # Save to config
             self.config.set("language", lang_code)
+            # Notify listeners such as loggers caching translations
+            for listener in self._change_listeners:
+                listener(self)
             return True
         return False
 
+    def add_change_listener(self, listener):
+        """
+        Register callback invoked after the current language changes
+
+        Args:
+            listener: Callable receiving this Language instance
+        """
+        self._change_listeners.append(listener)
+
+    def get_translations(self, lang_code=None):
+        """
+        Get translations dictionary for a language
+
+        Args:
+            lang_code: Language code (defaults to current language)
+
+        Returns:
+            dict: Language translations
+        """
+        return self._translations_for(lang_code or self.current_lang)
+
     def get_available_languages(self):
         """
         Get list of available languages
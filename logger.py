@@ -3,28 +3,10 @@
 
 import logging
 import os
-import codecs
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 
 
-class EncodedRotatingFileHandler(RotatingFileHandler):
-    """
-    Extended version of RotatingFileHandler that supports encoding
-    """
-
-    def __init__(
-        self, filename, mode="a", maxBytes=0, backupCount=0, encoding="utf-8", delay=0
-    ):
-        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
-
-    def _open(self):
-        """
-        Open the current base file with specific encoding
-        """
-        return codecs.open(self.baseFilename, self.mode, self.encoding)
-
-
 class Logger:
     """
     Logger class for managing application logging with multi-level support
@@ -39,6 +21,9 @@ class Logger:
         "critical": logging.CRITICAL,
     }
 
+    # Handlers keyed by (name, log_dir, date) so re-initialization reuses them
+    _HANDLER_CACHE = {}
+
     def __init__(
         self,
         name="osfipin",
@@ -66,18 +51,53 @@ class Logger:
         self.max_size = max_size
         self.backup_count = backup_count
         self.lang = None
+        self._lang_dict = {}
+        self._fallback_dict = None  # Loaded on first missing translation
 
         # Create logger
         self.logger = logging.getLogger(name)
         self.logger.setLevel(min(self.console_level, self.file_level))
 
+        # Reuse handlers already built for this logger, directory and date
+        date_str = datetime.now().strftime("%Y%m%d")
+        cache_key = (name, log_dir, date_str)
+        handlers = self._HANDLER_CACHE.get(cache_key)
+        if handlers is None:
+            handlers = self._create_handlers(log_dir, date_str)
+            self._HANDLER_CACHE[cache_key] = handlers
+        console_handler, file_handler = handlers
+
+        # Apply current levels and rotation limits to (possibly cached) handlers
+        console_handler.setLevel(self.console_level)
+        file_handler.setLevel(self.file_level)
+        file_handler.maxBytes = self.max_size
+        file_handler.backupCount = self.backup_count
+
+        # Install handlers only if the logger is not already using them
+        if self.logger.handlers != [console_handler, file_handler]:
+            # Clear any existing handlers
+            self.logger.handlers = []
+
+            # Add handlers to logger
+            self.logger.addHandler(console_handler)
+            self.logger.addHandler(file_handler)
+
+    def _create_handlers(self, log_dir, date_str):
+        """
+        Create console and rotating file handlers
+
+        Args:
+            log_dir: Directory to store log files
+            date_str: Date string used in log file name
+
+        Returns:
+            tuple: (console handler, file handler)
+        """
         # Create logs directory if it doesn't exist
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
 
         # Create log file with date in name
-        date_str = datetime.now().strftime("%Y%m%d")
-        log_file = os.path.join(log_dir, f"{name}_{date_str}.log")
+        log_file = os.path.join(log_dir, f"{self.name}_{date_str}.log")
 
         # Set up formatters
         console_formatter = logging.Formatter("%(levelname)s: %(message)s")
@@ -85,34 +105,40 @@ class Logger:
 
         # Set up console handler
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(self.console_level)
         console_handler.setFormatter(console_formatter)
 
-        # Set up file handler with rotation and UTF-8 encoding
-        file_handler = EncodedRotatingFileHandler(
+        # Set up file handler with rotation and UTF-8 encoding; the file is
+        # not opened until the first record is emitted
+        file_handler = RotatingFileHandler(
             log_file,
             maxBytes=self.max_size,
             backupCount=self.backup_count,
             encoding="utf-8",
+            delay=True,
         )
-        file_handler.setLevel(self.file_level)
         file_handler.setFormatter(file_formatter)
 
-        # Clear any existing handlers
-        self.logger.handlers = []
-
-        # Add handlers to logger
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        return console_handler, file_handler
 
     def set_language_instance(self, lang):
         """
         Set language instance for localized logging
 
         Args:
-            lang: Language instance with get method
+            lang: Language instance with get_translations method
         """
         self.lang = lang
+        self._cache_translations(lang)
+        lang.add_change_listener(self._cache_translations)
+
+    def _cache_translations(self, lang):
+        """
+        Cache current language translation dictionary for fast lookup
+
+        Args:
+            lang: Language instance with get_translations method
+        """
+        self._lang_dict = lang.get_translations()
 
     def _format_message(self, message, *args):
         """
@@ -127,7 +153,14 @@ class Logger:
         """
         if self.lang and isinstance(message, str) and not message.startswith("__"):
             try:
-                return self.lang.get(message, *args)
+                text = self._lang_dict.get(message)
+                if text is None:
+                    if self._fallback_dict is None:
+                        self._fallback_dict = self.lang.get_translations("en_us")
+                    text = self._fallback_dict.get(message, message)
+                if args:
+                    return text.format(*args)
+                return text
             except Exception:
                 # If translation fails, use original message with formatting
                 if args:
@@ -141,25 +174,42 @@ class Logger:
                 return message.format(*args)
             return message
 
+    def is_enabled_for(self, level):
+        """
+        Check whether messages of the given level would be logged
+
+        Args:
+            level: Level name (debug/info/warning/error/critical)
+
+        Returns:
+            bool: True if the level is enabled
+        """
+        return self.logger.isEnabledFor(self.LEVELS.get(level.lower(), logging.DEBUG))
+
     def debug(self, message, *args):
         """Log debug message"""
-        self.logger.debug(self._format_message(message, *args))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_message(message, *args))
 
     def info(self, message, *args):
         """Log info message"""
-        self.logger.info(self._format_message(message, *args))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_message(message, *args))
 
     def warning(self, message, *args):
         """Log warning message"""
-        self.logger.warning(self._format_message(message, *args))
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format_message(message, *args))
 
     def error(self, message, *args):
         """Log error message"""
-        self.logger.error(self._format_message(message, *args))
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(self._format_message(message, *args))
 
     def critical(self, message, *args):
         """Log critical message"""
-        self.logger.critical(self._format_message(message, *args))
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(self._format_message(message, *args))
 
 
 # Global logger instance
@@ -2,54 +2,149 @@
 # -*- coding: utf-8 -*-
 
 import requests
+from requests.adapters import HTTPAdapter
+import os
+import re
 import sys
-import json
 import time
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import queue
 import threading
-from config import Config
+from config import get_config, _loads
 from language import get_language_instance
 from logger import initialize_logger, get_logger
 
 
-def make_api_request(config):
+def _create_session():
     """
-    Make API request using configuration
+    Create HTTP session that reuses pooled keep-alive connections
+
+    Requests are never retried because the renewal endpoint is not safe
+    to repeat.
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": "osfipin/1.0"})
+    return session
+
+
+# Session for third-party time APIs (never carries credentials)
+_SESSION = _create_session()
+
+# Session for the certificate API, authorized once via _init_api_session
+_API_SESSION = _create_session()
+
+# Timeout in seconds for certificate API requests
+_API_TIMEOUT = 10
+
+# Directory and file names for saved certificates (data/<mark>/...)
+_DATA_DIR = "data"
+_CERT_NAME = "fullchain.crt"
+_KEY_NAME = "private.pem"
+
+# datetime.fromisoformat() parses a trailing "Z" since Python 3.11
+_ISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Timestamp field in the Cloudflare trace response body
+_TS_RE = re.compile(rb"ts=(\d+\.\d+)")
+
+
+class ApiContext:
+    """
+    Certificate API settings resolved once from configuration
+    """
+
+    __slots__ = ("base_url", "auth")
+
+    def __init__(self, config):
+        """
+        Initialize API context from configuration
+
+        Args:
+            config: Configuration instance
+        """
+        self.base_url = config.get("api_url")
+        # Authorization header uses Bearer token:user format
+        self.auth = f"Bearer {config.get('token')}:{config.get('username')}"
+
+
+def _init_api_session(config):
+    """
+    Build API context and set its authorization header on the API session
+
+    Args:
+        config: Configuration instance
+
+    Returns:
+        ApiContext: Resolved API settings
+    """
+    ctx = ApiContext(config)
+    _API_SESSION.headers["Authorization"] = ctx.auth
+    return ctx
+
+
+def make_api_request(ctx):
+    """
+    Make API request for the order list
+
+    Args:
+        ctx: API context
+
+    Returns:
+        tuple: (parsed response or None on failure, server time from Date
+            header or None)
     """
     logger = get_logger()
 
     # Prepare API URL
-    base_url = config.get("api_url")
     endpoint = "/api/user/Order/list"
-    url = f"{base_url}{endpoint}"
-
-    # Prepare authorization header with Bearer token:user format
-    token = config.get("token")
-    username = config.get("username")
-    auth_value = f"Bearer {token}:{username}"
-
-    # Set up headers and payload
-    headers = {"Authorization": auth_value}
-    payload = {}
+    url = f"{ctx.base_url}{endpoint}"
 
     # Make the request
     try:
         logger.debug("logger.debug.api.request", url)
-        response = requests.request("GET", url, headers=headers, data=payload)
+        response = _API_SESSION.get(url, timeout=_API_TIMEOUT)
         logger.debug("logger.debug.received.response", response.status_code)
-        return response.text
+        server_time = _parse_date_header(response.headers.get("Date"))
+        return _loads(response.content), server_time
     except requests.RequestException as e:
         error_msg = f"Request error: {str(e)}"
         logger.error(error_msg)
-        return error_msg
+    except ValueError:
+        logger.error("logger.error.request", "Invalid JSON response")
+    return None, None
 
 
-def make_renewal_api_request(config, domain_id, is_path=False):
+def _parse_date_header(value):
+    """
+    Parse an HTTP Date header
+
+    Args:
+        value: Header value, e.g. "Mon, 17 Apr 2023 12:34:56 GMT"
+
+    Returns:
+        datetime or None: Parsed time if valid, None otherwise
+    """
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def make_renewal_api_request(ctx, domain_id, is_path=False):
     """
     Make API request for domain renewal
 
     Args:
-        config: Configuration instance
+        ctx: API context
         domain_id: Domain ID to renew
         is_path: Whether to use path parameter (default: False)
 
@@ -59,81 +154,98 @@ def make_renewal_api_request(config, domain_id, is_path=False):
     logger = get_logger()
 
     # Prepare API URL
-    base_url = config.get("api_url")
     endpoint = (
         f"/api/user/OrderDetail/renew?id={domain_id}&is_path={str(is_path).lower()}"
     )
-    url = f"{base_url}{endpoint}"
-
-    # Prepare authorization header with Bearer token:user format
-    token = config.get("token")
-    username = config.get("username")
-    auth_value = f"Bearer {token}:{username}"
-
-    # Set up headers and payload
-    headers = {"Authorization": auth_value}
-    payload = {}
+    url = f"{ctx.base_url}{endpoint}"
 
     # Make the request
     try:
         logger.debug("renewal.debug.api.request", url)
-        response = requests.request("GET", url, headers=headers, data=payload)
+        response = _API_SESSION.get(url, timeout=_API_TIMEOUT)
         logger.debug("renewal.debug.api.response", response.status_code)
 
         # Parse and return JSON response
-        return json.loads(response.text)
+        return _loads(response.content)
     except requests.RequestException as e:
         error_msg = f"Renewal request error: {str(e)}"
         logger.error(error_msg)
         raise Exception(error_msg)
-    except json.JSONDecodeError:
+    except ValueError:
         error_msg = "Invalid JSON response from renewal API"
         logger.error(error_msg)
         raise Exception(error_msg)
 
 
-def download_certificate(config, cert_id):
+def download_certificate(ctx, cert_id):
     """
     Download certificate using provided ID
 
     Args:
-        config: Configuration instance
+        ctx: API context
         cert_id: Certificate ID to download
 
     Returns:
         dict: Parsed API response with certificate data
+
+    Raises:
+        Exception: If the request fails or the response is not valid JSON;
+            not logged here so that retried failures stay quiet
     """
     logger = get_logger()
 
     # Prepare API URL
-    base_url = config.get("api_url")
     endpoint = f"/api/user/OrderDetail/down?id={cert_id}&type=json"
-    url = f"{base_url}{endpoint}"
-
-    # Prepare authorization header
-    token = config.get("token")
-    username = config.get("username")
-    auth_value = f"Bearer {token}:{username}"
-
-    # Set up headers
-    headers = {"Authorization": auth_value}
+    url = f"{ctx.base_url}{endpoint}"
 
     # Make the request
     try:
         logger.debug("certificate.download.request", url)
-        response = requests.request("GET", url, headers=headers)
+        response = _API_SESSION.get(url, timeout=_API_TIMEOUT)
         logger.debug("certificate.download.response", response.status_code)
 
         # Parse and return JSON response
-        return json.loads(response.text)
+        return _loads(response.content)
     except requests.RequestException as e:
-        error_msg = f"Certificate download error: {str(e)}"
-        logger.error(error_msg)
-        raise Exception(error_msg)
-    except json.JSONDecodeError:
-        error_msg = "Invalid JSON response from certificate download API"
-        logger.error(error_msg)
-        raise Exception(error_msg)
+        raise Exception(f"Certificate download error: {str(e)}")
+    except ValueError:
+        raise Exception("Invalid JSON response from certificate download API")
+
+
+def download_certificate_with_retry(ctx, cert_id, attempts=5):
+    """
+    Download certificate, retrying with a short linear backoff while the
+    API reports an error or the request fails
+
+    Args:
+        ctx: API context
+        cert_id: Certificate ID to download
+        attempts: Maximum number of download attempts
+
+    Returns:
+        dict: Parsed API response of the last attempt
+
+    Raises:
+        Exception: If the last attempt fails
+    """
+    logger = get_logger()
+
+    for attempt in range(1, attempts + 1):
+        try:
+            cert_response = download_certificate(ctx, cert_id)
+            if attempt == attempts or (
+                cert_response.get("isOk", False)
+                and not cert_response.get("isError", True)
+            ):
+                return cert_response
+            error_message = cert_response.get("error", "Unknown error")
+        except Exception as e:
+            if attempt == attempts:
+                raise
+            error_message = str(e)
+
+        logger.debug("certificate.download.retry", attempt, error_message)
+        time.sleep(0.2 * attempt)
 
 
 def save_certificate_files(cert_data, mark):
@@ -147,24 +259,22 @@ def save_certificate_files(cert_data, mark):
     Returns:
         bool: True if files saved successfully, False otherwise
     """
-    import os
-
     logger = get_logger()
 
     # Ensure data directory exists
-    cert_dir = os.path.join("data", mark)
+    cert_dir = os.path.join(_DATA_DIR, mark)
     os.makedirs(cert_dir, exist_ok=True)
 
     try:
         # Save certificate file (fullchain.crt)
-        cert_file_path = os.path.join(cert_dir, "fullchain.crt")
-        with open(cert_file_path, "w", encoding="utf-8") as f:
-            f.write(cert_data.get("cert", ""))
+        cert_file_path = os.path.join(cert_dir, _CERT_NAME)
+        with open(cert_file_path, "wb") as f:
+            f.write(cert_data.get("cert", "").encode("utf-8"))
 
         # Save private key file (private.pem)
-        key_file_path = os.path.join(cert_dir, "private.pem")
-        with open(key_file_path, "w", encoding="utf-8") as f:
-            f.write(cert_data.get("key", ""))
+        key_file_path = os.path.join(cert_dir, _KEY_NAME)
+        with open(key_file_path, "wb") as f:
+            f.write(cert_data.get("key", "").encode("utf-8"))
 
         logger.info("certificate.save.success", cert_file_path, key_file_path)
         return True
@@ -173,9 +283,34 @@ def save_certificate_files(cert_data, mark):
         return False
 
 
-def _fetch_world_time_api():
+def _parse_dt(time_str):
     """
-    Fetch time from WorldTimeAPI
+    Parse a fixed-width "YYYY-MM-DD HH:MM:SS" string
+
+    Args:
+        time_str: Time string to parse
+
+    Returns:
+        datetime: Parsed naive datetime
+
+    Raises:
+        ValueError: If the string is not in the expected format
+    """
+    if len(time_str) != 19:
+        raise ValueError(f"Invalid time format: {time_str}")
+    return datetime(
+        int(time_str[0:4]),
+        int(time_str[5:7]),
+        int(time_str[8:10]),
+        int(time_str[11:13]),
+        int(time_str[14:16]),
+        int(time_str[17:19]),
+    )
+
+
+def _fetch_cloudflare_time():
+    """
+    Fetch time from Cloudflare trace endpoint
 
     Returns:
         datetime or None: Time from API if successful, None otherwise
@@ -183,17 +318,17 @@ def _fetch_world_time_api():
     logger = get_logger()
 
     try:
-        logger.debug("api.time.worldtime.fetching")
-        response = requests.get("http://worldtimeapi.org/api/ip", timeout=5)
+        logger.debug("api.time.cloudflare.fetching")
+        response = _SESSION.get("https://cloudflare.com/cdn-cgi/trace", timeout=5)
         if response.status_code == 200:
-            data = response.json()
-            if "datetime" in data:
-                # Format: 2023-04-17T12:34:56.789123+00:00
-                logger.debug("api.time.worldtime.parse.success")
-                return datetime.fromisoformat(data["datetime"])
-        logger.debug("api.time.worldtime.failed", response.status_code)
+            # Format: ts=1681734896.789 (Unix timestamp with fraction)
+            match = _TS_RE.search(response.content)
+            if match:
+                logger.debug("api.time.cloudflare.parse.success")
+                return datetime.fromtimestamp(float(match.group(1)), tz=timezone.utc)
+        logger.debug("api.time.cloudflare.failed", response.status_code)
     except Exception as e:
-        logger.debug("api.time.worldtime.exception", str(e))
+        logger.debug("api.time.cloudflare.exception", str(e))
 
     return None
 
@@ -209,16 +344,16 @@ def _fetch_world_clock_api():
 
     try:
         logger.debug("api.time.worldclock.fetching")
-        response = requests.get("http://worldclockapi.com/api/json/utc/now", timeout=5)
+        response = _SESSION.get("http://worldclockapi.com/api/json/utc/now", timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response.content)
             if "currentDateTime" in data:
                 time_str = data["currentDateTime"]
                 # Format: 2023-04-17T12:34:56.789Z
-                # Remove 'Z' if present and parse
-                if time_str.endswith("Z"):
-                    time_str = time_str[:-1]
-                    dt = datetime.fromisoformat(time_str)
+                # Remove 'Z' if present and parse, unless fromisoformat
+                # accepts it directly
+                if time_str.endswith("Z") and not _ISOFORMAT_ACCEPTS_Z:
+                    dt = datetime.fromisoformat(time_str[:-1])
                     logger.debug("api.time.worldclock.parse.success")
                     return dt.replace(tzinfo=timezone.utc)
                 else:
@@ -251,15 +386,15 @@ def _fetch_apihz_api(config):
         )
 
         logger.debug("api.time.apihz.fetching")
-        response = requests.get(apihz_url, timeout=5)
+        response = _SESSION.get(apihz_url, timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response.content)
 
             if data.get("code") == 200:
                 time_str = data.get("msg")
                 # Format: 2024-11-12 13:14:15
                 logger.debug("api.time.apihz.parse.success")
-                return datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
+                return _parse_dt(time_str)
 
         logger.debug("api.time.apihz.failed", response.status_code)
     except Exception as e:
@@ -282,67 +417,44 @@ def get_current_time(lang, config):
     logger = get_logger()
     logger.info("logger.info.fetching.network.time")
 
-    # Use a threading Event to signal that we've found a result
-    # This allows us to immediately return as soon as any API succeeds
-    success_event = threading.Event()
-    result_container = []
+    # Race all time APIs on daemon threads and return as soon as any of
+    # them succeeds; slower requests neither delay the result nor block
+    # interpreter exit
+    results = queue.Queue()
 
     def fetch_time_from_api(api_func, api_name, *args):
         """Worker function to fetch time from a specific API"""
-        # If another thread has already succeeded, don't even try
-        if success_event.is_set():
-            return
-
         try:
-            # Make the API call with appropriate args
-            if args:
-                result = api_func(*args)
-            else:
-                result = api_func()
-
-            # If we got a valid result, signal success and store the result
-            if result:
-                logger.info(f"api.time.{api_name}.success")
-                result_container.append(result)
-                # Signal to other threads that we're done
-                success_event.set()
-        except Exception:
-            # Only log failures if no success has occurred yet
-            if not success_event.is_set():
-                logger.debug(f"api.time.{api_name}.exception", str(sys.exc_info()[1]))
-
-    # Create and start threads for each API
-    threads = []
-
-    # WorldTime API thread
-    wt_thread = threading.Thread(
-        target=fetch_time_from_api, args=(_fetch_world_time_api, "worldtime")
-    )
-    threads.append(wt_thread)
-
-    # WorldClock API thread
-    wc_thread = threading.Thread(
-        target=fetch_time_from_api, args=(_fetch_world_clock_api, "worldclock")
-    )
-    threads.append(wc_thread)
-
-    # APIhz API thread
-    apihz_thread = threading.Thread(
-        target=fetch_time_from_api, args=(_fetch_apihz_api, "apihz", config)
+            results.put((api_name, api_func(*args)))
+        except Exception as e:
+            if logger.is_enabled_for("debug"):
+                logger.debug(f"api.time.{api_name}.exception", str(e))
+            results.put((api_name, None))
+
+    apis = (
+        (_fetch_cloudflare_time, "cloudflare"),
+        (_fetch_world_clock_api, "worldclock"),
+        (_fetch_apihz_api, "apihz", config),
     )
-    threads.append(apihz_thread)
-
-    # Start all threads
-    for thread in threads:
-        thread.daemon = True  # Make threads daemon so they don't block program exit
-        thread.start()
-
-    # Wait for either a success or timeout (max 5 seconds)
-    success_event.wait(timeout=5)
+    for api in apis:
+        threading.Thread(target=fetch_time_from_api, args=api, daemon=True).start()
+
+    # Wait for either a success, all APIs failing or timeout (max 5 seconds)
+    deadline = time.monotonic() + 5
+    for _ in apis:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            api_name, result = results.get(timeout=remaining)
+        except queue.Empty:
+            break
 
-    # If we got a result, return it immediately
-    if result_container:
-        return result_container[0]
+        # If we got a valid result, return it immediately
+        if result:
+            if logger.is_enabled_for("info"):
+                logger.info(f"api.time.{api_name}.success")
+            return result
 
     # If all APIs fail, fall back to local time
     logger.warning("logger.error.network.time")
@@ -363,7 +475,7 @@ def calculate_time_difference(time_end_str, current_time):
     logger = get_logger()
 
     # Parse the end time
-    time_end = datetime.strptime(time_end_str, "%Y-%m-%d %H:%M:%S")
+    time_end = _parse_dt(time_end_str)
     logger.debug("logger.debug.end.time.info", time_end_str, current_time)
 
     # Make both times timezone-naive for comparison if current_time has timezone
@@ -375,24 +487,87 @@ def calculate_time_difference(time_end_str, current_time):
     # Calculate difference
     diff = time_end - current_time
 
-    # Extract days, hours, minutes and seconds
-    days = diff.days
-    seconds = diff.seconds
-    hours = seconds // 3600
-    seconds %= 3600
-    minutes = seconds // 60
-    seconds %= 60
+    # Extract days, hours, minutes and seconds; an already expired
+    # certificate yields non-positive components (e.g. 0 days -1 hours)
+    # rather than timedelta's normalized -1 days 23 hours
+    total_seconds = int(diff.total_seconds())
+    sign = -1 if total_seconds < 0 else 1
+    days, rem = divmod(abs(total_seconds), 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, seconds = divmod(rem, 60)
+    days, hours, minutes, seconds = (
+        sign * days,
+        sign * hours,
+        sign * minutes,
+        sign * seconds,
+    )
 
     logger.debug("logger.debug.time.difference", days, hours, minutes, seconds)
     return days, hours, minutes, seconds
 
 
+def renew_certificate(ctx, config, domain_id, mark):
+    """
+    Renew certificate, then download and save the renewed certificate
+
+    Args:
+        ctx: API context
+        config: Configuration instance
+        domain_id: Domain ID to renew
+        mark: Mark for directory naming
+    """
+    logger = get_logger()
+
+    # Get is_path value from config, default to false
+    is_path = config.get("is_path", False)
+
+    try:
+        # Call renewal API
+        renewal_response = make_renewal_api_request(ctx, domain_id, is_path)
+
+        # Check if renewal was successful
+        if renewal_response.get("isOk", False) and not renewal_response.get(
+            "isError", True
+        ):
+            response_id = renewal_response.get("data", {}).get("id")
+            logger.info("renewal.success", response_id)
+
+            try:
+                # Download certificate after renewal, retrying briefly
+                # until the renewed certificate is available
+                cert_response = download_certificate_with_retry(ctx, response_id)
+
+                # Check if download was successful
+                if cert_response.get("isOk", False) and not cert_response.get(
+                    "isError", True
+                ):
+                    cert_data = cert_response.get("data", {})
+
+                    # Save certificate files
+                    if cert_data and save_certificate_files(cert_data, mark):
+                        logger.info("certificate.download.save.success")
+                    else:
+                        logger.error("certificate.download.save.failed")
+                else:
+                    # Extract error message from response
+                    error_message = cert_response.get("error", "Unknown error")
+                    logger.error("certificate.download.error", error_message)
+            except Exception as e:
+                logger.error("certificate.download.error", str(e))
+        else:
+            # Extract error message from response
+            error_message = renewal_response.get("error", "Unknown error")
+            logger.error("renewal.error.api", error_message)
+    except Exception as e:
+        logger.error("renewal.error.process", str(e))
+
+
 def main():
     """
     Main function
     """
     # Load configuration first
-    config = Config()
+    config = get_config()
 
     # Call validate_config to ensure all required keys exist
     config.validate_config()
@@ -425,16 +600,24 @@ def main():
     # Display config loading message
     logger.info("config.loaded", config.config_path)
 
-    # Get current time (from network or local)
-    current_time = get_current_time(lang, config)
+    # Resolve API settings and authorize API requests once for this run
+    ctx = _init_api_session(config)
 
     # Make API request
     logger.info("logger.info.making.request")
-    result = make_api_request(config)
+    response_data, current_time = make_api_request(ctx)
+    if response_data is None:
+        sys.exit(1)
+
+    # Use the API server's Date header as network time, falling back to
+    # the time APIs (or local time) when it is unavailable
+    if current_time:
+        logger.info("api.time.server.success")
+    else:
+        current_time = get_current_time(lang, config)
 
-    # Parse JSON response
+    # Process parsed JSON response
     try:
-        response_data = json.loads(result)
         logger.debug("logger.debug.parsed.api.response")
 
         # Check if API request was successful
@@ -452,18 +635,15 @@ def main():
         target_mark = config.get("target_mark", "")
         logger.debug("logger.debug.looking.mark", target_mark)
 
-        # Find item with the specified mark
-        found_item = None
-        for item in items:
-            if item.get("mark") == target_mark:
-                found_item = item
-                logger.debug("logger.debug.found.item.mark")
-                break
+        # Index items by mark (first occurrence wins) and find the target
+        by_mark = {item.get("mark"): item for item in reversed(items)}
+        found_item = by_mark.get(target_mark)
 
         # If item not found, display error and exit
         if not found_item:
             logger.error("logger.error.mark.not.found", target_mark)
             sys.exit(1)
+        logger.debug("logger.debug.found.item.mark")
 
         # Get time_end value
         time_end = found_item.get("time_end")
@@ -482,10 +662,6 @@ def main():
         domains_str = ", ".join(domains) if domains else "N/A"
         logger.info("certificate.info", domains_str, time_end)
 
-        # Add pause notification before renewal check
-        logger.info("renewal.info.pausing")
-        time.sleep(1)
-
         # Get domain_id for potential renewal
         domain_id = found_item.get("id")
 
@@ -493,60 +669,15 @@ def main():
         if days < 14:
             logger.warning("renewal.warning.expiring", domain_id)
 
-            # Get is_path value from config, default to false
-            is_path = config.get("is_path", False)
-
-            try:
-                # Call renewal API
-                renewal_response = make_renewal_api_request(config, domain_id, is_path)
-
-                # Check if renewal was successful
-                if renewal_response.get("isOk", False) and not renewal_response.get(
-                    "isError", True
-                ):
-                    response_id = renewal_response.get("data", {}).get("id")
-                    logger.info("renewal.success", response_id)
-
-                    # Wait 1 second before downloading certificate
-                    logger.debug("certificate.download.waiting")
-                    time.sleep(1)
-
-                    try:
-                        # Download certificate after renewal
-                        cert_response = download_certificate(config, response_id)
-
-                        # Check if download was successful
-                        if cert_response.get("isOk", False) and not cert_response.get(
-                            "isError", True
-                        ):
-                            cert_data = cert_response.get("data", {})
-
-                            # Save certificate files
-                            if cert_data and save_certificate_files(
-                                cert_data, target_mark
-                            ):
-                                logger.info("certificate.download.save.success")
-                            else:
-                                logger.error("certificate.download.save.failed")
-                        else:
-                            # Extract error message from response
-                            error_message = cert_response.get("error", "Unknown error")
-                            logger.error("certificate.download.error", error_message)
-                    except Exception as e:
-                        logger.error("certificate.download.error", str(e))
-                else:
-                    # Extract error message from response
-                    error_message = renewal_response.get("error", "Unknown error")
-                    logger.error("renewal.error.api", error_message)
-            except Exception as e:
-                logger.error("renewal.error.process", str(e))
+            if config.get("auto_renew", True):
+                renew_certificate(ctx, config, domain_id, target_mark)
+            else:
+                # Automatic renewal disabled in config, only warn
+                logger.info("renewal.disabled")
         else:
             # Certificate doesn't need renewal
             logger.info("renewal.not.needed", domain_id)
 
-    except json.JSONDecodeError:
-        logger.error("logger.error.request", "Invalid JSON response")
-        sys.exit(1)
     except Exception as e:
         logger.error("logger.error.request", str(e))
         sys.exit(1)